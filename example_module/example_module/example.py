@@ -1,7 +1,7 @@
 """Example numba-compiled functions"""
 
 import numpy as np
-from numba_wasm.util import njit_wasm, global_variable
+from numba_wasm.util import njit_wasm, global_variable, fuse
 
 global_counter_getter, global_counter_setter, global_counter_spec = global_variable(
     "global_counter", 0, np.uint32
@@ -74,3 +74,20 @@ def increment_global_counter_function():
 def get_global_counter() -> np.uint32:
     """Function that returns the global variable ``global_counter``"""
     return global_counter_getter()
+
+
+@njit_wasm
+def add_ten(input_value: np.uint32) -> np.uint32:
+    """Basic elementwise scalar addition function example"""
+    return input_value + np.uint32(10)
+
+
+@njit_wasm
+def double(input_value: np.uint32) -> np.uint32:
+    """Basic elementwise scalar multiplication function example"""
+    return input_value * np.uint32(2)
+
+
+# single exported kernel returning a new array of (x + 10) * 2 for each element,
+# leaving the input array unmodified
+add_ten_and_double_array_function = fuse(add_ten, double)
@@ -5,6 +5,7 @@ import os
 import typing
 from inspect import getmodule
 from copy import copy
+from functools import reduce
 import ctypes
 import numpy as np
 
@@ -12,9 +13,13 @@ BUILD_WASM_IR = os.environ.get("BUILD_WASM_IR", "0") == "1"
 
 if sys.platform == "emscripten" and not BUILD_WASM_IR:
     import js
+
+    numba = None
 else:
     import numba
+    from numba.core.errors import NumbaNotImplementedError
     from numba.core.typing.asnumbatype import as_numba_type as _as_numba_type
+    from numba.np.numpy_support import as_dtype
     from numba.extending import intrinsic
     from numba.core.externals import _add_missing_symbol
     from llvmlite import ir
@@ -108,6 +113,120 @@ def njit_wasm(function=None, **kwargs):
         return wrapper(function)
 
 
+def _as_numpy_scalar_type(annotation):
+    """Convert a scalar annotation (builtin, numpy, or numba type) to its numpy scalar type.
+
+    Returns None if the annotation does not describe a scalar."""
+    # np.dtype(None) is float64, so a missing annotation must be rejected explicitly
+    if annotation is None or typing.get_origin(annotation) is np.ndarray:
+        return None
+    if numba is not None and isinstance(annotation, numba.types.Type):
+        try:
+            dtype = as_dtype(annotation)
+        except NumbaNotImplementedError:
+            return None
+    else:
+        try:
+            dtype = np.dtype(annotation)
+        except TypeError:
+            return None
+    if dtype.kind not in "biufc":
+        return None
+    return dtype.type
+
+
+def _elementwise_types(func) -> tuple:
+    """Get the numpy scalar argument and return types of an elementwise function.
+
+    Raises TypeError if the function does not map a single scalar argument to a scalar."""
+    function_annotations = copy(func.__annotations__)
+    return_type = _as_numpy_scalar_type(function_annotations.pop("return", None))
+    argument_types = tuple(
+        _as_numpy_scalar_type(value) for value in function_annotations.values()
+    )
+    if return_type is None or len(argument_types) != 1 or argument_types[0] is None:
+        raise TypeError(
+            f"{func.__name__} is not elementwise, "
+            "fused stages must take a single scalar argument and return a scalar"
+        )
+    return argument_types[0], return_type
+
+
+def _compose(first, second):
+    """Compose two elementwise functions into one inlined njit function"""
+
+    @numba.njit(inline="always", no_cfunc_wrapper=True)
+    def composed(value):
+        return second(first(value))
+
+    return composed
+
+
+def fuse(*functions, ndim: int = 1, symbol=None):
+    """Fuse elementwise njit_wasm functions into a single exported array kernel.
+
+    Each stage must take a single scalar argument and return a scalar of the type the next
+    stage takes, and stages are applied in the order given, i.e. ``fuse(f, g)`` computes
+    ``g(f(x))`` for each element.
+
+    The fused kernel takes an ``ndim``-dimensional array of the first stage's argument type
+    and returns a new array of the last stage's return type, running every stage in a single
+    loop without allocating intermediate arrays.
+
+    The kernel is itself wrapped with njit_wasm, so it can be passed to build_wasm_ir_module
+    alongside other functions and called directly in both CPython and pyodide.
+
+    If keyword ``symbol`` is specified, the default symbol name
+    (module.fused_stage1_stage2... with a ``_{ndim}d`` suffix when ndim != 1)
+    is overwritten with the specified string."""
+
+    if not functions:
+        raise ValueError("fuse requires at least one function")
+    # pyodide wrappers and numba dispatchers both expose the original function as py_func
+    py_funcs = tuple(getattr(function, "py_func", function) for function in functions)
+    stage_types = tuple(_elementwise_types(py_func) for py_func in py_funcs)
+    for stage_index in range(1, len(py_funcs)):
+        if np.dtype(stage_types[stage_index - 1][1]) != np.dtype(
+            stage_types[stage_index][0]
+        ):
+            raise TypeError(
+                f"{py_funcs[stage_index].__name__} does not accept the return type of "
+                f"{py_funcs[stage_index - 1].__name__}, "
+                "fused stages must take the return type of the previous stage"
+            )
+
+    input_type = stage_types[0][0]
+    output_type = stage_types[-1][1]
+    name = "fused_" + "_".join(py_func.__name__ for py_func in py_funcs)
+    if ndim != 1:
+        name += f"_{ndim}d"
+
+    # in pyodide only the annotations of the kernel are used to call the wasm export
+    stage_chain = None if numba is None else reduce(_compose, functions)
+
+    def fused(input_array):
+        output_array = np.empty(input_array.shape, output_type)
+        flat_input = input_array.reshape(input_array.size)
+        flat_output = output_array.reshape(output_array.size)
+        for index in range(flat_input.size):
+            flat_output[index] = stage_chain(flat_input[index])
+        return output_array
+
+    fused.__name__ = name
+    fused.__qualname__ = name
+    # exported symbol is derived from the module of the first stage
+    fused.__module__ = py_funcs[0].__module__
+    fused.__annotations__ = {
+        "input_array": np.ndarray[ndim, input_type],
+        "return": np.ndarray[ndim, output_type],
+    }
+    fused.__doc__ = "Fused elementwise kernel of " + ", ".join(
+        py_func.__name__ for py_func in py_funcs
+    )
+
+    return njit_wasm(fused, symbol=symbol)
+
+
 class NumpyHolder:
     """Holder class for WASM-created numpy array"""
 